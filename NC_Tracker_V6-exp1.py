@@ -1,33 +1,41 @@
 import os
+import re
 import sys
-import shutil
 import time
 import ctypes
+import functools
+import importlib.util
+import sqlite3
 from datetime import date, datetime
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
-from PySide6.QtCore import Qt, QDate, QPoint
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+from PySide6.QtCore import (
+    Qt, QDate, QPoint, QTimer, QAbstractTableModel, QModelIndex, QFileSystemWatcher,
+    QObject, QRunnable, QThreadPool, Signal
+)
 from PySide6.QtGui import QAction, QIcon, QPainter, QPixmap, QColor, QKeySequence
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QRadioButton, QButtonGroup, QDateEdit, QTextEdit, QTableWidget, QTableWidgetItem,
+    QRadioButton, QButtonGroup, QDateEdit, QTextEdit, QTableView,
     QAbstractItemView, QHeaderView, QMessageBox, QMenu, QStatusBar, QFrame, QLineEdit,
     QFileDialog
 )
 
-# Excel
-try:
-    from openpyxl import Workbook, load_workbook
-except ImportError:
-    print("This tool requires 'openpyxl'. Install it with: pip install openpyxl", file=sys.stderr)
-    sys.exit(1)
-
 APP_TITLE = "Network Changes Tracker"
 FILE_NAME = "network_changes.xlsx"
 SHEETS = ("CR", "WP")
 HEADERS = ("Approval Date", "Request Number", "Description of Work")
 DATE_NUMBER_FORMAT = "yyyy-mm-dd"
+# Hidden defined name recording the sheet layout version (3 = three-column layout)
+SCHEMA_NAME = "NCT_SchemaVersion"
+SCHEMA_VERSION = "3"
 
 # UI colours
 ACCENT = "#0E9AA7"
@@ -72,6 +80,7 @@ def get_data_dir() -> Path:
 DATA_DIR = get_data_dir()
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 EXCEL_PATH = DATA_DIR / FILE_NAME
+DB_PATH = DATA_DIR / "tracker.db"
 
 
 # -------- OneDrive helper for export --------
@@ -106,6 +115,22 @@ def find_onedrive_dir() -> Path:
     return home
 
 
+def _fast_copy(src: Path, dst: Path):
+    """
+    Copy file contents without a user-space read/write loop where possible:
+    CopyFileExW on Windows, otherwise shutil.copyfile, which already uses
+    sendfile on Linux and fcopyfile on macOS.
+    """
+    if sys.platform == "win32":
+        try:
+            if ctypes.windll.kernel32.CopyFileExW(str(src), str(dst), None, None, None, 0):
+                return
+        except OSError:
+            pass
+    import shutil
+    shutil.copyfile(src, dst)
+
+
 # -------- Robust save helpers (atomic save + simple lock + Excel lock detect) --------
 
 def excel_lock_exists(path: Path) -> bool:
@@ -114,51 +139,69 @@ def excel_lock_exists(path: Path) -> bool:
     return lock.exists()
 
 
-def acquire_file_lock(path: Path, timeout: float = 10.0) -> Optional[Tuple[Path, int]]:
+def acquire_file_lock(path: Path, timeout: float = 10.0) -> Optional[int]:
     """
-    Try to acquire a simple lock using a .lock file next to 'path'.
-    Returns (lock_path, fd) if acquired, or None on timeout.
+    Take an OS-level lock on a .lock file next to 'path' (flock on POSIX,
+    msvcrt.locking on Windows). The kernel releases it if the process dies,
+    so a leftover .lock file never blocks anyone.
+    Returns the locked fd, or None on timeout.
     """
     lock_path = path.with_suffix(path.suffix + ".lock")
-    deadline = time.time() + timeout
-    while time.time() < deadline:
+    fd = os.open(str(lock_path), os.O_RDWR | os.O_CREAT)
+    deadline = time.monotonic() + timeout
+    while True:
         try:
-            fd = os.open(str(lock_path), os.O_CREAT | os.O_EXCL | os.O_RDWR)
-            os.write(fd, f"pid={os.getpid()} time={time.time()}".encode("utf-8"))
-            return lock_path, fd
-        except FileExistsError:
-            time.sleep(0.2)
-        except Exception:
-            time.sleep(0.2)
-    return None
+            if sys.platform == "win32":
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return fd
+        except OSError:
+            if time.monotonic() >= deadline:
+                os.close(fd)
+                return None
+            time.sleep(0.01)
 
 
-def release_file_lock(lock: Optional[Tuple[Path, int]]):
-    if not lock:
+def release_file_lock(fd: Optional[int]):
+    if fd is None:
         return
-    lock_path, fd = lock
     try:
-        try:
-            os.close(fd)
-        except Exception:
-            pass
-        if lock_path.exists():
-            try:
-                lock_path.unlink()
-            except Exception:
-                pass
-    except Exception:
+        if sys.platform == "win32":
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    except OSError:
         pass
+    finally:
+        os.close(fd)
+
+
+def _fsync_path(path: Path, flags: int = os.O_RDWR):
+    # Windows needs write access to flush a file handle
+    fd = os.open(str(path), flags)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 
 def safe_save_workbook(wb, path: Path):
     """
     Atomic save: write to a tmp file in the same directory then replace.
+    The tmp file is fsynced before the rename and the directory after it,
+    so a crash cannot leave an empty workbook behind. fsync errors are not
+    swallowed: a failed fsync means the data may not be on disk.
     """
     tmp = path.with_suffix(path.suffix + f".tmp.{os.getpid()}")
     path.parent.mkdir(parents=True, exist_ok=True)
     wb.save(tmp)
+    _fsync_path(tmp)
     os.replace(tmp, path)
+    # Directories cannot be opened/fsynced on Windows
+    if hasattr(os, "O_DIRECTORY"):
+        _fsync_path(path.parent, os.O_RDONLY | os.O_DIRECTORY)
 
 
 def save_wb_with_lock(wb, path: Path):
@@ -168,7 +211,7 @@ def save_wb_with_lock(wb, path: Path):
             f"Please close the workbook first:\n{path}"
         )
     lock = acquire_file_lock(path, timeout=10.0)
-    if not lock:
+    if lock is None:
         raise PermissionError(
             f"File appears busy. Try again in a moment.\n\n{path}\n\n"
             "If the file is in OneDrive, ensure it is 'Always keep on this device' and not actively syncing."
@@ -179,6 +222,26 @@ def save_wb_with_lock(wb, path: Path):
         release_file_lock(lock)
 
 
+def _schema_current(wb) -> bool:
+    dn = wb.defined_names.get(SCHEMA_NAME)
+    return dn is not None and dn.attr_text == SCHEMA_VERSION
+
+
+def _mark_schema(wb):
+    from openpyxl.workbook.defined_name import DefinedName
+    # Hidden workbook-level name; Excel keeps it across saves
+    wb.defined_names[SCHEMA_NAME] = DefinedName(SCHEMA_NAME, attr_text=SCHEMA_VERSION, hidden=True)
+
+
+def _is_blank(v) -> bool:
+    return v is None or (isinstance(v, str) and not v.strip())
+
+
+def _header_is(v, text: str) -> bool:
+    # Exact match first; only strip when it differs
+    return v == text or (isinstance(v, str) and v.strip() == text)
+
+
 def _migrate_two_to_three_columns(ws) -> bool:
     """
     If the sheet has old layout:
@@ -187,24 +250,26 @@ def _migrate_two_to_three_columns(ws) -> bool:
     Returns True if migration performed.
     """
     try:
-        a1 = (ws["A1"].value or "").strip()
-        b1 = (ws["B1"].value or "").strip()
-        c1 = ws["C1"].value
-        if a1 == "Approval Date" and b1 == "Description of Work" and (c1 is None or str(c1).strip() == ""):
+        a1, b1, c1 = next(ws.iter_rows(min_row=1, max_row=1, max_col=3, values_only=True))
+        if _header_is(a1, HEADERS[0]) and _header_is(b1, HEADERS[2]) and _is_blank(c1):
             # Only migrate if column C is empty across data rows to avoid overwriting user data.
-            has_c_data = any((ws.cell(row=r, column=3).value not in (None, "")) for r in range(2, ws.max_row + 1))
+            has_c_data = False
+            for (c,) in ws.iter_rows(min_row=2, min_col=3, max_col=3, values_only=True):
+                if c not in (None, ""):
+                    has_c_data = True
+                    break
             if has_c_data:
                 # Do not migrate to avoid data loss; just set headers (keeps old data in B).
-                ws["B1"] = "Request Number"
-                ws["C1"] = "Description of Work"
+                ws["B1"] = HEADERS[1]
+                ws["C1"] = HEADERS[2]
                 return False
-            # Move data B -> C
-            for r in range(2, ws.max_row + 1):
-                ws.cell(row=r, column=3).value = ws.cell(row=r, column=2).value
-                ws.cell(row=r, column=2).value = None
+            # Move data B -> C in one pass over the existing cells
+            for b, c in ws.iter_rows(min_row=2, min_col=2, max_col=3):
+                c.value = b.value
+                b.value = None
             # Set headers
-            ws["B1"] = "Request Number"
-            ws["C1"] = "Description of Work"
+            ws["B1"] = HEADERS[1]
+            ws["C1"] = HEADERS[2]
             return True
     except Exception:
         pass
@@ -212,27 +277,29 @@ def _migrate_two_to_three_columns(ws) -> bool:
 
 
 def ensure_workbook_and_sheets(path: Path):
+    from openpyxl import Workbook, load_workbook
     path.parent.mkdir(parents=True, exist_ok=True)
     dirty = False
-    if path.exists():
-        wb = load_workbook(path)
-    else:
-        wb = Workbook()
-        dirty = True
-        if "Sheet" in wb.sheetnames and len(wb.sheetnames) == 1:
-            wb.remove(wb["Sheet"])
+    if not path.exists():
+        # Fresh file: stream the header rows out, then load it for normal use
+        new_wb = Workbook(write_only=True)
+        for sheet_name in SHEETS:
+            new_wb.create_sheet(title=sheet_name).append(list(HEADERS))
+        _mark_schema(new_wb)
+        save_wb_with_lock(new_wb, path)
+        return load_workbook(path)
+    wb = load_workbook(path)
+    # Files we already migrated (or wrote) carry the schema marker; skip the layout checks
+    schema_current = _schema_current(wb)
     for sheet_name in SHEETS:
         if sheet_name not in wb.sheetnames:
             ws = wb.create_sheet(title=sheet_name)
-            ws["A1"] = HEADERS[0]
-            ws["B1"] = HEADERS[1]
-            ws["C1"] = HEADERS[2]
+            ws.append(HEADERS)
             dirty = True
         else:
             ws = wb[sheet_name]
-            a1 = ws["A1"].value
-            b1 = ws["B1"].value
-            c1 = ws["C1"].value
+            row1 = next(ws.iter_rows(min_row=1, max_row=1, max_col=3, values_only=True), (None, None, None))
+            a1, b1, c1 = row1
             # If all headers empty, write headers
             if (a1 is None) and (b1 is None) and (c1 is None):
                 ws["A1"] = HEADERS[0]
@@ -241,70 +308,50 @@ def ensure_workbook_and_sheets(path: Path):
                 dirty = True
             else:
                 # Attempt migration if needed
-                migrated = _migrate_two_to_three_columns(ws)
+                migrated = not schema_current and _migrate_two_to_three_columns(ws)
                 if migrated:
                     dirty = True
                 else:
                     # Ensure header text matches (don’t touch user data positions)
                     changed = False
-                    if (ws["A1"].value or "").strip() == "":
-                        ws["A1"] = HEADERS[0]
-                        changed = True
-                    if (ws["B1"].value or "").strip() == "":
-                        ws["B1"] = HEADERS[1]
-                        changed = True
-                    if (ws["C1"].value or "").strip() == "":
-                        ws["C1"] = HEADERS[2]
-                        changed = True
+                    for cell, header in zip(next(ws.iter_rows(min_row=1, max_row=1, max_col=3)), HEADERS):
+                        if _is_blank(cell.value):
+                            cell.value = header
+                            changed = True
                     if changed:
                         dirty = True
+    if not schema_current:
+        _mark_schema(wb)
+        dirty = True
     if dirty:
         save_wb_with_lock(wb, path)
     return wb
 
 
-def normalize_description(text: str) -> str:
-    if not text:
-        return ""
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    parts = [line.strip() for line in text.split("\n")]
-    parts = [p for p in parts if p]
-    return ", ".join(parts)
+_LINE_SPLIT = re.compile(r"[\r\n]+")
 
 
-def append_row(path: Path, sheet_name: str, d: date, req_num: str, desc: str):
-    wb = ensure_workbook_and_sheets(path)
-    if sheet_name not in wb.sheetnames:
-        ws = wb.create_sheet(title=sheet_name)
-        ws["A1"] = HEADERS[0]
-        ws["B1"] = HEADERS[1]
-        ws["C1"] = HEADERS[2]
-    ws = wb[sheet_name]
-    ws.append([d, req_num, desc])
-    last_row = ws.max_row
-    ws.cell(row=last_row, column=1).number_format = DATE_NUMBER_FORMAT
-    try:
-        save_wb_with_lock(wb, path)
-    except PermissionError:
-        raise PermissionError(
-            f"Cannot save the Excel file.\n\nFile may be open or folder not writable:\n{path}\n\n"
-            "Close the file if open, or move the EXE and Excel to a writable folder (e.g., Desktop/Documents)."
-        )
+def normalize_description(text: str) -> str:
+    return ", ".join(p for p in (line.strip() for line in _LINE_SPLIT.split(text or "")) if p)
 
 
-def read_rows(path: Path, sheet_name: str) -> List[Tuple[str, str, str]]:
-    if not path.exists():
-        return []
-    wb = load_workbook(path, data_only=True)
+def xlsx_rows(wb, sheet_name: str) -> List[Tuple[str, str, str]]:
     if sheet_name not in wb.sheetnames:
         return []
     ws = wb[sheet_name]
+    # Some writers store a bogus A1:A1 dimension, which truncates read-only iteration
+    if wb.read_only and ws.max_row == 1 and ws.max_column == 1:
+        ws.reset_dimensions()
     rows: List[Tuple[str, str, str]] = []
-    for row in ws.iter_rows(min_row=2, values_only=True):
-        approval_date, req_num, description = (row + (None, None, None))[:3]
+    # max_col=3 always yields 3-tuples, so no padding/slicing per row
+    for approval_date, req_num, description in ws.iter_rows(min_row=2, max_col=3, values_only=True):
         if approval_date is None and req_num is None and description is None:
             continue
-        if isinstance(approval_date, (datetime, date)):
+        t = type(approval_date)
+        if t is datetime or t is date:
+            # Same as strftime("%Y-%m-%d"), without strftime's per-call overhead
+            dstr = f"{approval_date.year:04d}-{approval_date.month:02d}-{approval_date.day:02d}"
+        elif isinstance(approval_date, (datetime, date)):
             dstr = approval_date.strftime("%Y-%m-%d")
         elif approval_date:
             dstr = str(approval_date)
@@ -314,6 +361,187 @@ def read_rows(path: Path, sheet_name: str) -> List[Tuple[str, str, str]]:
     return rows
 
 
+# -------- Local store (SQLite is the source of truth; the .xlsx is generated) --------
+
+def open_db(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Autocommit: a single INSERT is its own transaction; bulk work uses _transaction()
+    conn = sqlite3.connect(str(path), isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # Safe with WAL (no corruption on power loss, at worst the last commit is lost)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    with _transaction(conn):
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "id INTEGER PRIMARY KEY, sheet TEXT NOT NULL, approval_date TEXT, req TEXT, description TEXT)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_sheet ON entries (sheet, id)")
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+    return conn
+
+
+# One long-lived connection per database file, shared by every read and write
+_DB_POOL: Dict[Path, sqlite3.Connection] = {}
+
+
+def get_db(path: Path) -> sqlite3.Connection:
+    conn = _DB_POOL.get(path)
+    if conn is None:
+        conn = _DB_POOL[path] = open_db(path)
+    return conn
+
+
+def close_db(path: Path):
+    conn = _DB_POOL.pop(path, None)
+    if conn is not None:
+        conn.close()
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection):
+    # IMMEDIATE takes the write lock up front, so a read-then-write transaction
+    # cannot fail halfway when the other connection (MaterializeTask) has written
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def _get_meta(conn: sqlite3.Connection, key: str) -> Optional[str]:
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def _set_meta(conn: sqlite3.Connection, key: str, value: Optional[str]):
+    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+
+def _xlsx_mtime(path: Path) -> Optional[str]:
+    return str(path.stat().st_mtime_ns) if path.exists() else None
+
+
+def _headers_current(wb) -> bool:
+    for sheet_name in SHEETS:
+        if sheet_name not in wb.sheetnames:
+            return False
+        ws = wb[sheet_name]
+        if ws.max_row == 1 and ws.max_column == 1:
+            ws.reset_dimensions()  # bogus A1:A1 dimension would hide B1:C1
+        row1 = next(ws.iter_rows(min_row=1, max_row=1, max_col=3, values_only=True), None)
+        if row1 != HEADERS:
+            return False
+    return True
+
+
+def _synced_id(conn: sqlite3.Connection) -> int:
+    """Highest entry id the workbook is known to contain; later rows exist only in the database."""
+    return int(_get_meta(conn, "xlsx_synced_id") or 0)
+
+
+def db_ahead_of_xlsx(conn: sqlite3.Connection) -> bool:
+    row = conn.execute("SELECT EXISTS (SELECT 1 FROM entries WHERE id > ?)", (_synced_id(conn),)).fetchone()
+    return bool(row[0])
+
+
+def sync_from_xlsx(conn: sqlite3.Connection, path: Path) -> bool:
+    """
+    If the workbook changed since we last wrote it (e.g. edited in Excel),
+    replace the stored rows with its contents. Rows added since the workbook was
+    last written are not in it yet; they are kept and re-added after the import.
+    Returns True if rows were imported.
+    """
+    mtime = _xlsx_mtime(path)
+    # Without a recorded high-water mark (first run) the workbook is the reference
+    known = _get_meta(conn, "xlsx_synced_id") is not None
+    if known and mtime == _get_meta(conn, "xlsx_mtime_ns"):
+        return False
+    if mtime is None:
+        # Workbook was removed; the database still has everything and the next
+        # write has to recreate all of it
+        with _transaction(conn):
+            _set_meta(conn, "xlsx_mtime_ns", None)
+            _set_meta(conn, "xlsx_synced_id", "0")
+        return False
+    # Stream the workbook read-only; fall back to the full model only when
+    # sheets or headers need fixing (migration writes to the file).
+    from openpyxl import load_workbook
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        if not _headers_current(wb):
+            wb.close()
+            wb = ensure_workbook_and_sheets(path)
+        rows = {sheet_name: xlsx_rows(wb, sheet_name) for sheet_name in SHEETS}
+    finally:
+        wb.close()
+    with _transaction(conn):
+        pending = conn.execute(
+            "SELECT sheet, approval_date, req, description FROM entries WHERE id > ? ORDER BY id",
+            (_synced_id(conn),),
+        ).fetchall() if known else []
+        conn.execute("DELETE FROM entries")
+        for sheet_name in SHEETS:
+            conn.executemany(
+                "INSERT INTO entries (sheet, approval_date, req, description) VALUES (?, ?, ?, ?)",
+                ((sheet_name, dstr, req, desc) for dstr, req, desc in rows[sheet_name]),
+            )
+        synced = conn.execute("SELECT COALESCE(MAX(id), 0) FROM entries").fetchone()[0]
+        conn.executemany(
+            "INSERT INTO entries (sheet, approval_date, req, description) VALUES (?, ?, ?, ?)", pending
+        )
+        _set_meta(conn, "xlsx_synced_id", str(synced))
+        _set_meta(conn, "xlsx_mtime_ns", _xlsx_mtime(path))
+    return True
+
+
+def append_row(conn: sqlite3.Connection, sheet_name: str, d: date, req_num: str, desc: str):
+    conn.execute(
+        "INSERT INTO entries (sheet, approval_date, req, description) VALUES (?, ?, ?, ?)",
+        (sheet_name, d.strftime("%Y-%m-%d"), req_num, desc),
+    )
+
+
+def read_rows(conn: sqlite3.Connection, sheet_name: str) -> List[Tuple[str, str, str]]:
+    return conn.execute(
+        "SELECT COALESCE(approval_date, ''), COALESCE(req, ''), COALESCE(description, '') "
+        "FROM entries WHERE sheet = ? ORDER BY id",
+        (sheet_name,),
+    ).fetchall()
+
+
+def materialize_xlsx(conn: sqlite3.Connection, path: Path):
+    """
+    Bring the workbook at 'path' up to date with the database. Edits made in
+    Excel are imported first, then only the rows the workbook lacks are appended,
+    so the user's own sheets, columns and formatting are kept.
+    """
+    sync_from_xlsx(conn, path)
+    if not path.exists():
+        _set_meta(conn, "xlsx_synced_id", "0")
+    synced = _synced_id(conn)
+    new_rows = conn.execute(
+        "SELECT id, sheet, approval_date, req, description FROM entries WHERE id > ? ORDER BY id",
+        (synced,),
+    ).fetchall()
+    if new_rows or not path.exists():
+        wb = ensure_workbook_and_sheets(path)
+        for row_id, sheet_name, dstr, req, desc in new_rows:
+            try:
+                value = date.fromisoformat(dstr)
+            except (TypeError, ValueError):
+                value = dstr
+            # openpyxl gives date values the yyyy-mm-dd number format
+            wb[sheet_name].append([value, req, desc])
+            synced = row_id
+        if new_rows:
+            save_wb_with_lock(wb, path)
+    with _transaction(conn):
+        _set_meta(conn, "xlsx_synced_id", str(synced))
+        _set_meta(conn, "xlsx_mtime_ns", _xlsx_mtime(path))
+
+
 def emoji_icon(emoji: str, size: int = 128,
                bg=QColor(14, 154, 167), fg=QColor(255, 255, 255)) -> QIcon:
     pm = QPixmap(size, size)
@@ -329,7 +557,9 @@ def emoji_icon(emoji: str, size: int = 128,
     return QIcon(pm)
 
 
+@functools.lru_cache(maxsize=1)
 def load_window_icon() -> QIcon:
+    # Cached: the emoji fallback is a full QPainter rasterization
     # Try common icon names next to the script/exe
     for name in ("app.ico", "app.png", "app.icns"):
         p = app_dir() / name
@@ -339,14 +569,131 @@ def load_window_icon() -> QIcon:
     return emoji_icon("📡")
 
 
+class EntriesModel(QAbstractTableModel):
+    """Read-only model over (date, request number, description) rows; no per-cell items."""
+
+    _FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Tuple[str, str, str]] = []
+
+    def set_rows(self, rows: List[Tuple[str, str, str]]):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def add_row(self, row: Tuple[str, str, str]):
+        n = len(self._rows)
+        self.beginInsertRows(QModelIndex(), n, n)
+        self._rows.append(row)
+        self.endInsertRows()
+
+    def row_values(self, row: int) -> Tuple[str, str, str]:
+        return self._rows[row]
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def flags(self, index):
+        return self._FLAGS if index.isValid() else Qt.NoItemFlags
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class _TaskSignals(QObject):
+    finished = Signal()
+    failed = Signal(str, str)  # dialog title, message
+
+
+class _SyncSignals(QObject):
+    finished = Signal(bool)  # True if rows were imported
+    failed = Signal(str, str)  # dialog title, message
+
+
+class SyncTask(QRunnable):
+    """Runs sync_from_xlsx on a pool thread, with its own connection."""
+
+    def __init__(self, db_path: Path, xlsx_path: Path):
+        super().__init__()
+        self.db_path = db_path
+        self.xlsx_path = xlsx_path
+        self.signals = _SyncSignals()
+
+    def run(self):
+        conn = open_db(self.db_path)
+        try:
+            imported = sync_from_xlsx(conn, self.xlsx_path)
+        except PermissionError as e:
+            self.signals.failed.emit("Cannot save", str(e))
+        except Exception as e:
+            self.signals.failed.emit("Error", f"Failed to read Excel:\n{e}")
+        else:
+            self.signals.finished.emit(imported)
+        finally:
+            conn.close()
+
+
+class MaterializeTask(QRunnable):
+    """Runs materialize_xlsx on a pool thread, with its own connection."""
+
+    def __init__(self, db_path: Path, xlsx_path: Path):
+        super().__init__()
+        self.db_path = db_path
+        self.xlsx_path = xlsx_path
+        self.signals = _TaskSignals()
+
+    def run(self):
+        conn = open_db(self.db_path)
+        try:
+            materialize_xlsx(conn, self.xlsx_path)
+        except PermissionError as e:
+            self.signals.failed.emit("Cannot save", str(e))
+        except Exception as e:
+            self.signals.failed.emit("Error", f"Failed to write Excel:\n{e}")
+        else:
+            self.signals.finished.emit()
+        finally:
+            conn.close()
+
+
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, icon: QIcon):
         super().__init__()
         self.setWindowTitle(APP_TITLE)
         self.setMinimumSize(980, 680)
-        self.setWindowIcon(load_window_icon())
-
-        ensure_workbook_and_sheets(EXCEL_PATH)
+        self.setWindowIcon(icon)
+
+        # Last workbook mtime seen; the import check runs again only when it changes
+        self._xlsx_mtime: Optional[str] = None
+        # Actions waiting for the background workbook task (SyncTask or
+        # MaterializeTask) to finish; each re-checks its own preconditions
+        self._after_write: List = []
+
+        # Rows per sheet as last read from the database; dropped when the workbook
+        # changes on disk or on an explicit refresh. The model shares these lists.
+        self._rows_cache: Dict[str, List[Tuple[str, str, str]]] = {}
+        self._dirty = True
+        self._last_sheet: Optional[str] = None
+        self.watcher = QFileSystemWatcher(self)
+        self._watch_excel()
+        self.watcher.fileChanged.connect(self._on_file_changed)
+        # Excel saves via temp file + rename; let it settle before re-importing
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(500)
+        self._reload_timer.timeout.connect(self.load_table)
 
         central = QWidget()
         root = QVBoxLayout(central)
@@ -410,7 +757,12 @@ class MainWindow(QMainWindow):
         desc_frame = QVBoxLayout()
         lbl_desc = QLabel("Description of Work (multi-line allowed)")
         self.desc_text = QTextEdit()
-        self.desc_text.textChanged.connect(self.update_preview)
+        # Coalesce bursts of keystrokes into one preview update
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(100)
+        self._preview_timer.timeout.connect(self._do_update_preview)
+        self.desc_text.textChanged.connect(self._preview_timer.start)
         self.desc_text.setPlaceholderText("Enter work description; multiple lines will be joined with commas")
         desc_frame.addWidget(lbl_desc)
         desc_frame.addWidget(self.desc_text)
@@ -438,7 +790,7 @@ class MainWindow(QMainWindow):
         self.btn_export.clicked.connect(self.on_export_to_onedrive)
 
         self.btn_refresh = QPushButton("Refresh List")
-        self.btn_refresh.clicked.connect(self.load_table)
+        self.btn_refresh.clicked.connect(self.refresh)
 
         tip = QLabel("Shortcuts: Ctrl+Enter Add • Ctrl+L Clear • Ctrl+T Today • Ctrl+O Open • F5 Refresh")
         tip.setStyleSheet("color:#4A6C74;")
@@ -453,13 +805,15 @@ class MainWindow(QMainWindow):
         root.addLayout(btn_row)
 
         # Table (3 columns)
-        self.table = QTableWidget(0, 3)
-        self.table.setHorizontalHeaderLabels(HEADERS)
+        self.model = EntriesModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        # Sized once per load in load_table; ResizeToContents re-measures on every row change
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Interactive)
+        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Interactive)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.on_table_context_menu)
@@ -474,9 +828,9 @@ class MainWindow(QMainWindow):
         # Shortcuts
         self._add_shortcuts()
 
-        # Initial load
-        self.load_table()
-        self.update_preview()
+        # Initial load once the window is shown, so the UI paints before any file I/O
+        QTimer.singleShot(0, self.load_table)
+        self._do_update_preview()
 
         # Styling
         self._apply_styles()
@@ -486,7 +840,7 @@ class MainWindow(QMainWindow):
             QWidget {{ background: {BG_LIGHT}; color: {TEXT_PRIMARY}; }}
             QRadioButton, QLabel {{ font-size: 12px; }}
             QTextEdit {{ background: white; border: 1px solid #D0E3E6; }}
-            QTableWidget {{ background: white; alternate-background-color: {ROW_ALT}; }}
+            QTableView {{ background: white; alternate-background-color: {ROW_ALT}; }}
             QPushButton {{ padding: 6px 10px; }}
         """)
 
@@ -502,7 +856,7 @@ class MainWindow(QMainWindow):
         add_seq("Ctrl+L", self.on_clear)
         add_seq("Ctrl+T", self.set_today)
         add_seq("Ctrl+O", self.open_excel)
-        add_seq("F5", self.load_table)
+        add_seq("F5", self.refresh)
 
     def set_today(self):
         self.date_edit.setDate(QDate.currentDate())
@@ -510,14 +864,14 @@ class MainWindow(QMainWindow):
     def on_clear(self):
         self.desc_text.clear()
         # Do not clear date; we handle Request Number after adding
-        self.update_preview()
+        self._do_update_preview()
 
     def on_add(self):
+        if not self.btn_add.isEnabled():
+            return  # previous Add still waiting for the workbook import (keyboard shortcut)
         sheet = "CR" if self.rb_cr.isChecked() else "WP"
 
-        # Convert QDate to Python date
-        dqt = self.date_edit.date()
-        d_py = date(dqt.year(), dqt.month(), dqt.day())
+        d_py = self.date_edit.date().toPython()
 
         req_num = self.req_edit.text().strip()
         desc = normalize_description(self.desc_text.toPlainText())
@@ -531,11 +885,15 @@ class MainWindow(QMainWindow):
         #     QMessageBox.critical(self, "Missing request number", "Please enter the Request Number.")
         #     return
 
+        # One Add at a time; re-enabled once the row is stored
+        self.btn_add.setEnabled(False)
+        # Pick up edits made in Excel first so they are not overwritten later
+        self._sync_excel(lambda: self._append_entry(sheet, d_py, req_num, desc))
+
+    def _append_entry(self, sheet: str, d_py: date, req_num: str, desc: str):
+        self.btn_add.setEnabled(True)
         try:
-            append_row(EXCEL_PATH, sheet, d_py, req_num, desc)
-        except PermissionError as e:
-            QMessageBox.critical(self, "Cannot save", str(e))
-            return
+            append_row(self.db, sheet, d_py, req_num, desc)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to add entry:\n{e}")
             return
@@ -548,33 +906,108 @@ class MainWindow(QMainWindow):
         # 2) Clear Request Number to avoid accidental reuse
         self.req_edit.clear()
         self.req_edit.setFocus()
-        # 3) Refresh table
-        self.load_table()
+        # 3) Show the new row (full reload if the workbook was re-imported or
+        #    another sheet is on screen by now)
+        if self._dirty or sheet != self._last_sheet:
+            self._rows_cache.pop(sheet, None)
+            self.load_table()
+        else:
+            # The model's list is the cached list for this sheet, so the cache stays current
+            self.model.add_row((d_py.strftime("%Y-%m-%d"), req_num, desc))
+            self.table.scrollToBottom()
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        return get_db(DB_PATH)
+
+    def _sync_excel(self, then):
+        """
+        Import edits made in Excel, then call then(). The import parses the
+        workbook, so it runs on a pool thread; then() runs at once if the
+        workbook is unchanged.
+        """
+        if self._after_write:
+            # A workbook task is running; check again once it is done
+            self._after_write.append(lambda: self._sync_excel(then))
+            return
+        if _xlsx_mtime(EXCEL_PATH) == self._xlsx_mtime:
+            then()
+            return
+        self._after_write.append(then)
+        task = SyncTask(DB_PATH, EXCEL_PATH)
+        task.signals.finished.connect(self._on_excel_synced)
+        task.signals.failed.connect(self._on_excel_task_failed)
+        self.update_status("Reading Excel file…")
+        QThreadPool.globalInstance().start(task)
+
+    def _on_excel_synced(self, imported: bool):
+        # The mtime the import saw, so a save made while it ran is still picked up
+        self._xlsx_mtime = _get_meta(self.db, "xlsx_mtime_ns")
+        self._watch_excel()
+        if imported:
+            self._dirty = True
+        self._run_after_write()
+
+    def _run_after_write(self):
+        pending, self._after_write = self._after_write, []
+        for then in pending:
+            then()
+        # Changes seen by the watcher while the task ran were skipped
+        self._on_file_changed(str(EXCEL_PATH))
+
+    def _watch_excel(self):
+        # A replaced file drops out of the watcher, so re-add it whenever it exists
+        path = str(EXCEL_PATH)
+        if EXCEL_PATH.exists() and path not in self.watcher.files():
+            self.watcher.addPath(path)
+
+    def _on_file_changed(self, path: str):
+        self._watch_excel()
+        if self._after_write:
+            return  # MaterializeTask is replacing the file
+        if _xlsx_mtime(EXCEL_PATH) == self._xlsx_mtime:
+            return  # our own write, or no real change
+        self._dirty = True
+        self._reload_timer.start()
 
     def on_sheet_changed(self):
         self.load_table()
 
-    def update_preview(self):
-        text = self.desc_text.toPlainText().strip()
-        combined = normalize_description(text)
+    def _do_update_preview(self):
+        # normalize_description strips each line itself
+        combined = normalize_description(self.desc_text.toPlainText())
         self.preview.setText(combined or "(nothing yet)")
 
+    def refresh(self):
+        self._dirty = True
+        self.load_table()
+
     def load_table(self):
+        sheet = "CR" if self.rb_cr.isChecked() else "WP"
+        if not self._dirty and self._last_sheet == sheet:
+            return
+        if self._dirty:
+            self._sync_excel(self._show_table)
+        else:
+            self._show_table()
+
+    def _show_table(self):
         sheet = "CR" if self.rb_cr.isChecked() else "WP"
         try:
-            ensure_workbook_and_sheets(EXCEL_PATH)
-            rows = read_rows(EXCEL_PATH, sheet)
+            if self._dirty:
+                self._rows_cache.clear()
+                self._dirty = False
+            rows = self._rows_cache.get(sheet)
+            if rows is None:
+                rows = self._rows_cache[sheet] = read_rows(self.db, sheet)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to read Excel:\n{e}")
             return
 
-        self.table.setRowCount(0)
-        for dstr, req, desc in rows:
-            r = self.table.rowCount()
-            self.table.insertRow(r)
-            self.table.setItem(r, 0, QTableWidgetItem(dstr))
-            self.table.setItem(r, 1, QTableWidgetItem(req))
-            self.table.setItem(r, 2, QTableWidgetItem(desc))
+        self.model.set_rows(rows)
+        self.table.resizeColumnToContents(0)
+        self.table.resizeColumnToContents(1)
+        self._last_sheet = sheet
 
         self.update_status(f"File: {EXCEL_PATH} • {sheet} records: {len(rows)}")
 
@@ -590,12 +1023,10 @@ class MainWindow(QMainWindow):
         menu.exec(self.table.viewport().mapToGlobal(pos))
 
     def copy_selected_row(self):
-        row = self.table.currentRow()
+        row = self.table.currentIndex().row()
         if row < 0:
             return
-        d = self.table.item(row, 0).text() if self.table.item(row, 0) else ""
-        req = self.table.item(row, 1).text() if self.table.item(row, 1) else ""
-        desc = self.table.item(row, 2).text() if self.table.item(row, 2) else ""
+        d, req, desc = self.model.row_values(row)
         text = f"{d}\t{req}\t{desc}"
         QApplication.clipboard().setText(text)
         self.update_status("Row copied to clipboard.")
@@ -619,9 +1050,12 @@ class MainWindow(QMainWindow):
             if resp != QMessageBox.Yes:
                 return
 
+        self._write_excel_file(lambda: self._copy_export(dest_path))
+
+    def _copy_export(self, dest_path: Path):
         try:
             tmp = dest_path.with_suffix(dest_path.suffix + f".tmp.{os.getpid()}")
-            shutil.copy2(EXCEL_PATH, tmp)
+            _fast_copy(EXCEL_PATH, tmp)
             os.replace(tmp, dest_path)
         except Exception as e:
             QMessageBox.critical(self, "Export failed", f"Could not export to OneDrive:\n{e}")
@@ -631,7 +1065,49 @@ class MainWindow(QMainWindow):
 
     # -------- Common --------
 
+    def _write_excel_file(self, then):
+        """
+        Append the rows the workbook lacks (keeping any edits made in Excel),
+        then call then(). The write runs on a pool thread so the UI stays responsive.
+        """
+        if self._after_write:
+            # A workbook task is running; check again once it is done
+            self._after_write.append(lambda: self._write_excel_file(then))
+            return
+        if _xlsx_mtime(EXCEL_PATH) != self._xlsx_mtime:
+            # Import edits made in Excel first; that decides what is missing
+            self._sync_excel(lambda: self._write_excel_file(then))
+            return
+        # Skip the rewrite if the workbook already has every stored row
+        if not db_ahead_of_xlsx(self.db) and EXCEL_PATH.exists():
+            then()
+            return
+        # Rows added while the task runs are not in the file yet; check again after it
+        self._after_write.append(lambda: self._write_excel_file(then))
+        task = MaterializeTask(DB_PATH, EXCEL_PATH)
+        task.signals.finished.connect(self._on_excel_written)
+        task.signals.failed.connect(self._on_excel_task_failed)
+        self.update_status("Writing Excel file…")
+        QThreadPool.globalInstance().start(task)
+
+    def _on_excel_written(self):
+        self._xlsx_mtime = _get_meta(self.db, "xlsx_mtime_ns")
+        self._watch_excel()
+        # The task imports Excel edits before writing; show whatever is stored now
+        self._dirty = True
+        self._run_after_write()
+        self.load_table()
+
+    def _on_excel_task_failed(self, title: str, message: str):
+        self._after_write = []
+        self._watch_excel()
+        self.btn_add.setEnabled(True)  # a queued Add was dropped with the rest
+        QMessageBox.critical(self, title, message)
+
     def open_excel(self):
+        self._write_excel_file(self._open_excel_file)
+
+    def _open_excel_file(self):
         path = str(EXCEL_PATH)
         try:
             if sys.platform.startswith("win"):
@@ -648,8 +1124,20 @@ class MainWindow(QMainWindow):
     def update_status(self, text: str):
         self.status.showMessage(text)
 
+    def closeEvent(self, event):
+        # Let a pending workbook write finish
+        QThreadPool.globalInstance().waitForDone()
+        # Checkpoints the WAL back into tracker.db
+        close_db(DB_PATH)
+        super().closeEvent(event)
+
 
 def main():
+    # openpyxl is imported lazily where it is used; fail early if it is missing
+    if importlib.util.find_spec("openpyxl") is None:
+        print("This tool requires 'openpyxl'. Install it with: pip install openpyxl", file=sys.stderr)
+        sys.exit(1)
+
     # Windows: set AppUserModelID for proper taskbar icon/grouping
     if sys.platform == "win32":
         try:
@@ -657,16 +1145,13 @@ def main():
         except Exception:
             pass
 
-    ensure_workbook_and_sheets(EXCEL_PATH)
-
     app = QApplication(sys.argv)
     app.setApplicationName(APP_TITLE)
 
     ico = load_window_icon()
     app.setWindowIcon(ico)
 
-    w = MainWindow()
-    w.setWindowIcon(ico)
+    w = MainWindow(ico)
     w.show()
     sys.exit(app.exec())
 
@@ -1,30 +1,39 @@
 import os
 import sys
 import ctypes
-from datetime import date, datetime
+import functools
+import importlib.util
+import posixpath
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple, Optional
 
-from PySide6.QtCore import Qt, QDate, QPoint
+from PySide6.QtCore import (
+    Qt, QDate, QPoint, QTimer, QAbstractTableModel, QModelIndex, QObject, QThread, Signal, Slot
+)
 from PySide6.QtGui import QAction, QIcon, QPainter, QPixmap, QColor, QKeySequence
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QRadioButton, QButtonGroup, QDateEdit, QTextEdit, QTableWidget, QTableWidgetItem,
+    QRadioButton, QButtonGroup, QDateEdit, QTextEdit, QTableView,
     QAbstractItemView, QHeaderView, QMessageBox, QMenu, QStatusBar, QFrame, QLineEdit
 )
 
-# Excel
+# Optional: python-calamine (Rust xlsx reader) for faster table loads
 try:
-    from openpyxl import Workbook, load_workbook
+    from python_calamine import CalamineWorkbook
 except ImportError:
-    print("This tool requires 'openpyxl'. Install it with: pip install openpyxl", file=sys.stderr)
-    sys.exit(1)
+    CalamineWorkbook = None
 
 APP_TITLE = "Network Changes Tracker"
 FILE_NAME = "network_changes.xlsx"
 SHEETS = ("CR", "WP")
 HEADERS = ("Approval Date", "Request Number", "Description of Work")
 DATE_NUMBER_FORMAT = "yyyy-mm-dd"
+# A table row: (approval date as read from the sheet, request number, description)
+Row = Tuple[object, str, str]
 
 # UI colours
 ACCENT = "#0E9AA7"
@@ -67,16 +76,16 @@ def _migrate_two_to_three_columns(ws) -> bool:
         c1 = ws["C1"].value
         if a1 == "Approval Date" and b1 == "Description of Work" and (c1 is None or str(c1).strip() == ""):
             # Only migrate if column C is empty across data rows to avoid overwriting user data.
-            has_c_data = any((ws.cell(row=r, column=3).value not in (None, "")) for r in range(2, ws.max_row + 1))
+            has_c_data = any(c not in (None, "") for (c,) in ws.iter_rows(min_row=2, min_col=3, max_col=3, values_only=True))
             if has_c_data:
                 # Do not migrate to avoid data loss; just set headers (keeps old data in B).
                 ws["B1"] = "Request Number"
                 ws["C1"] = "Description of Work"
                 return False
-            # Move data B -> C
-            for r in range(2, ws.max_row + 1):
-                ws.cell(row=r, column=3).value = ws.cell(row=r, column=2).value
-                ws.cell(row=r, column=2).value = None
+            # Move data B -> C in one pass over the existing cells
+            for b, c in ws.iter_rows(min_row=2, min_col=2, max_col=3):
+                c.value = b.value
+                b.value = None
             # Set headers
             ws["B1"] = "Request Number"
             ws["C1"] = "Description of Work"
@@ -86,20 +95,57 @@ def _migrate_two_to_three_columns(ws) -> bool:
     return False
 
 
+def save_workbook(wb, path: Path):
+    """
+    Write to a temp file next to path, then os.replace it, so a failed save
+    never leaves a truncated workbook. Deflate level 1 instead of openpyxl's
+    default 6: several times faster, and barely larger for this small XML.
+    """
+    from openpyxl.writer.excel import ExcelWriter
+    # Same guards as Workbook.save, which cannot take a compression level
+    if wb.read_only:
+        raise TypeError("Workbook is read-only")
+    if wb.write_only and not wb.worksheets:
+        wb.create_sheet()
+    # Per-process name so two running instances never share a temp file
+    tmp = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+    try:
+        archive = zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED, allowZip64=True, compresslevel=1)
+        try:
+            # Same as openpyxl's save_workbook, which always uses the default level
+            wb.properties.modified = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+            ExcelWriter(wb, archive).save()
+        finally:
+            archive.close()
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 def ensure_workbook_and_sheets(path: Path):
+    from openpyxl import Workbook, load_workbook
     path.parent.mkdir(parents=True, exist_ok=True)
-    if path.exists():
-        wb = load_workbook(path)
-    else:
-        wb = Workbook()
-        if "Sheet" in wb.sheetnames and len(wb.sheetnames) == 1:
-            wb.remove(wb["Sheet"])
+    # Only write the file back when something was actually created or fixed
+    dirty = False
+    if not path.exists():
+        # Fresh file: stream the header rows out, then load it for normal use
+        new_wb = Workbook(write_only=True)
+        for sheet_name in SHEETS:
+            ws = new_wb.create_sheet(title=sheet_name)
+            ws.column_dimensions["A"].number_format = DATE_NUMBER_FORMAT
+            ws.append(list(HEADERS))
+        save_workbook(new_wb, path)
+        return load_workbook(path)
+    wb = load_workbook(path)
     for sheet_name in SHEETS:
         if sheet_name not in wb.sheetnames:
             ws = wb.create_sheet(title=sheet_name)
+            ws.column_dimensions["A"].number_format = DATE_NUMBER_FORMAT
             ws["A1"] = HEADERS[0]
             ws["B1"] = HEADERS[1]
             ws["C1"] = HEADERS[2]
+            dirty = True
         else:
             ws = wb[sheet_name]
             a1 = ws["A1"].value
@@ -110,6 +156,7 @@ def ensure_workbook_and_sheets(path: Path):
                 ws["A1"] = HEADERS[0]
                 ws["B1"] = HEADERS[1]
                 ws["C1"] = HEADERS[2]
+                dirty = True
             else:
                 # Attempt migration if needed
                 migrated = _migrate_two_to_three_columns(ws)
@@ -121,32 +168,35 @@ def ensure_workbook_and_sheets(path: Path):
                         ws["B1"] = HEADERS[1]
                     if (ws["C1"].value or "").strip() == "":
                         ws["C1"] = HEADERS[2]
-    wb.save(path)
+                # Migration (even a skipped one) and header fixes all show up in row 1
+                if (ws["A1"].value, ws["B1"].value, ws["C1"].value) != (a1, b1, c1):
+                    dirty = True
+    if dirty:
+        save_workbook(wb, path)
     return wb
 
 
 def normalize_description(text: str) -> str:
     if not text:
         return ""
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    parts = [line.strip() for line in text.split("\n")]
-    parts = [p for p in parts if p]
-    return ", ".join(parts)
-
-
-def append_row(path: Path, sheet_name: str, d: date, req_num: str, desc: str):
-    wb = ensure_workbook_and_sheets(path)
-    if sheet_name not in wb.sheetnames:
-        ws = wb.create_sheet(title=sheet_name)
-        ws["A1"] = HEADERS[0]
-        ws["B1"] = HEADERS[1]
-        ws["C1"] = HEADERS[2]
-    ws = wb[sheet_name]
-    ws.append([d, req_num, desc])
-    last_row = ws.max_row
-    ws.cell(row=last_row, column=1).number_format = DATE_NUMBER_FORMAT
+    # splitlines() handles \r\n, \r, \n (and other line breaks) in one pass
+    return ", ".join(p for p in (line.strip() for line in text.splitlines()) if p)
+
+
+def append_rows(wb, path: Path, entries: List[Tuple[str, date, str, str]]):
+    """Append (sheet, date, request number, description) entries and save once."""
+    for sheet_name, d, req_num, desc in entries:
+        if sheet_name not in wb.sheetnames:
+            ws = wb.create_sheet(title=sheet_name)
+            ws.column_dimensions["A"].number_format = DATE_NUMBER_FORMAT
+            ws["A1"] = HEADERS[0]
+            ws["B1"] = HEADERS[1]
+            ws["C1"] = HEADERS[2]
+        # openpyxl already gives date values the yyyy-mm-dd number format
+        wb[sheet_name].append([d, req_num, desc])
+    _drop_read_cache(path)
     try:
-        wb.save(path)
+        save_workbook(wb, path)
     except PermissionError:
         raise PermissionError(
             f"Cannot save the Excel file.\n\nFile may be open or folder not writable:\n{path}\n\n"
@@ -154,25 +204,235 @@ def append_row(path: Path, sheet_name: str, d: date, req_num: str, desc: str):
         )
 
 
-def read_rows(path: Path, sheet_name: str) -> List[Tuple[str, str, str]]:
+_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_NS_DOC_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_NS_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+def _xml_sheet_part(z: zipfile.ZipFile, sheet_name: str) -> Tuple[Optional[str], bool]:
+    """Return (zip member of the named sheet or None, workbook uses the 1904 date system)."""
+    wb_root = ET.fromstring(z.read("xl/workbook.xml"))
+    pr = wb_root.find(f"{_NS}workbookPr")
+    date1904 = pr is not None and pr.get("date1904") in ("1", "true")
+    rid = None
+    for sh in wb_root.iter(f"{_NS}sheet"):
+        if sh.get("name") == sheet_name:
+            rid = sh.get(f"{_NS_DOC_REL}id")
+            break
+    if rid is None:
+        return None, date1904
+    for rel in ET.fromstring(z.read("xl/_rels/workbook.xml.rels")).iter(f"{_NS_PKG_REL}Relationship"):
+        if rel.get("Id") == rid:
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                return target.lstrip("/"), date1904
+            return posixpath.normpath(posixpath.join("xl", target)), date1904
+    raise KeyError(rid)
+
+
+def _xml_shared_strings(z: zipfile.ZipFile) -> List[str]:
+    if "xl/sharedStrings.xml" not in z.namelist():
+        return []
+    strings: List[str] = []
+    with z.open("xl/sharedStrings.xml") as f:
+        for _, elem in ET.iterparse(f, events=("end",)):
+            if elem.tag == f"{_NS}si":
+                # Plain <t>, or rich-text runs <r><t>; phonetic <rPh> runs are not cell text
+                parts = [elem.findtext(f"{_NS}t") or ""]
+                parts.extend(r.findtext(f"{_NS}t") or "" for r in elem.iterfind(f"{_NS}r"))
+                strings.append("".join(parts))
+                elem.clear()
+    return strings
+
+
+def _xml_col(ref: str) -> int:
+    col = 0
+    for ch in ref:
+        if not ch.isalpha():
+            break
+        col = col * 26 + ord(ch.upper()) - 64
+    return col
+
+
+# Built-in numFmtIds that are dates/times (ECMA-376 18.8.30, including the CJK ones)
+_XML_DATE_FMT_IDS = frozenset([*range(14, 23), *range(27, 37), *range(45, 48), *range(50, 59)])
+# Quoted text, escaped characters and [colour]/[$currency] sections never make a format a date
+_XML_FMT_LITERALS = re.compile(r'"[^"]*"|\\.|\[[^\]]*\]')
+
+
+def _xml_date_styles(z: zipfile.ZipFile) -> frozenset:
+    """Indexes into cellXfs (a cell's s attribute) whose number format is a date."""
+    if "xl/styles.xml" not in z.namelist():
+        return frozenset()
+    root = ET.fromstring(z.read("xl/styles.xml"))
+    date_ids = set(_XML_DATE_FMT_IDS)
+    for fmt in root.iter(f"{_NS}numFmt"):
+        code = _XML_FMT_LITERALS.sub("", fmt.get("formatCode", ""))
+        if re.search(r"[dmyhs]", code, re.IGNORECASE):
+            date_ids.add(int(fmt.get("numFmtId", -1)))
+    xfs = root.find(f"{_NS}cellXfs")
+    if xfs is None:
+        return frozenset()
+    return frozenset(
+        i for i, xf in enumerate(xfs.iterfind(f"{_NS}xf")) if int(xf.get("numFmtId", 0)) in date_ids
+    )
+
+
+def _xml_number(text: str):
+    return float(text) if any(ch in text for ch in ".eE") else int(text)
+
+
+def _xml_rows(path: Path, sheet_name: str):
+    """
+    Raw (A, B, C) values from row 2 down, parsed straight from the sheet XML.
+    Numbers whose cell style has a date format are converted from Excel date serials.
+    Returns None when the sheet does not exist.
+    """
+    with zipfile.ZipFile(path) as z:
+        part, date1904 = _xml_sheet_part(z, sheet_name)
+        if part is None:
+            return None
+        shared = _xml_shared_strings(z)
+        date_styles = _xml_date_styles(z)
+        epoch = datetime(1904, 1, 1) if date1904 else datetime(1899, 12, 30)
+        rows = []
+        row_idx = 0
+        values = [None, None, None]
+        col = 0
+        with z.open(part) as f:
+            for event, elem in ET.iterparse(f, events=("start", "end")):
+                tag = elem.tag
+                if event == "start":
+                    if tag == f"{_NS}row":
+                        r = elem.get("r")
+                        row_idx = int(r) if r else row_idx + 1
+                        values = [None, None, None]
+                        col = 0
+                    continue
+                if tag == f"{_NS}c":
+                    ref = elem.get("r")
+                    col = _xml_col(ref) if ref else col + 1
+                    if 1 <= col <= 3:
+                        t = elem.get("t")
+                        if t == "inlineStr":
+                            is_ = elem.find(f"{_NS}is")
+                            val = "".join(x.text or "" for x in is_.iter(f"{_NS}t")) if is_ is not None else None
+                        else:
+                            v = elem.findtext(f"{_NS}v")
+                            if not v:
+                                val = None  # no cached value, e.g. a formula openpyxl wrote
+                            elif t == "s":
+                                val = shared[int(v)]
+                            elif t in ("str", "e"):
+                                val = v
+                            elif t == "b":
+                                val = v == "1"
+                            elif t == "d":
+                                val = datetime.fromisoformat(v)
+                            else:
+                                val = _xml_number(v)
+                                if date_styles and int(elem.get("s", 0)) in date_styles:
+                                    try:
+                                        val = epoch + timedelta(days=val)
+                                    except OverflowError:
+                                        pass  # not a representable date; show the number
+                        values[col - 1] = val
+                    elem.clear()
+                elif tag == f"{_NS}row":
+                    if row_idx >= 2:
+                        rows.append(tuple(values))
+                    elem.clear()
+        return rows
+
+
+def _calamine_rows(path: Path, sheet_name: str):
+    wb = CalamineWorkbook.from_path(str(path))
+    if sheet_name not in wb.sheet_names:
+        return None
+    # Keep empty leading rows/columns so values stay aligned with A1
+    data = wb.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False)
+    rows = []
+    for row in data[1:]:
+        values = [None, None, None]
+        for i, v in enumerate(row[:3]):
+            if v == "":
+                continue
+            # calamine reports every number as float; openpyxl gives whole numbers as int
+            if type(v) is float and v.is_integer():
+                v = int(v)
+            values[i] = v
+        rows.append(tuple(values))
+    return rows
+
+
+def _openpyxl_rows(path: Path, sheet_name: str):
+    from openpyxl import load_workbook
+    # Read-only mode streams the sheet XML instead of building every cell in memory
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        if sheet_name not in wb.sheetnames:
+            return None
+        ws = wb[sheet_name]
+        # Some writers store a bogus A1:A1 dimension, which truncates read-only iteration
+        if ws.max_row == 1 and ws.max_column == 1:
+            ws.reset_dimensions()
+        return [(row + (None, None, None))[:3] for row in ws.iter_rows(min_row=2, values_only=True)]
+    finally:
+        # Required in read-only mode to release the zip file handle
+        wb.close()
+
+
+def _parse_rows(path: Path, sheet_name: str):
+    """Raw (A, B, C) values from row 2 down, or None when the sheet does not exist."""
+    if CalamineWorkbook is not None:
+        try:
+            return _calamine_rows(path, sheet_name)
+        except Exception:
+            pass  # fall back to the pure-Python readers
+    try:
+        return _xml_rows(path, sheet_name)
+    except (zipfile.BadZipFile, KeyError, ValueError, IndexError, OverflowError, ET.ParseError):
+        # Anything unusual in the package: let openpyxl deal with it
+        return _openpyxl_rows(path, sheet_name)
+
+
+# (path, sheet) -> (mtime_ns, size, rows) of the last parse
+_READ_CACHE: Dict[Tuple[str, str], Tuple[int, int, List[Row]]] = {}
+
+
+def _drop_read_cache(path: Path):
+    for key in [k for k in _READ_CACHE if k[0] == str(path)]:
+        del _READ_CACHE[key]
+
+
+def format_date(value) -> str:
+    t = type(value)
+    if t is datetime or t is date:
+        # Same as strftime("%Y-%m-%d"), without strftime's per-call overhead
+        return f"{value.year:04d}-{value.month:02d}-{value.day:02d}"
+    if isinstance(value, (datetime, date)):
+        return value.strftime("%Y-%m-%d")
+    return str(value) if value else ""
+
+
+def read_rows(path: Path, sheet_name: str) -> List[Row]:
     if not path.exists():
         return []
-    wb = load_workbook(path, data_only=True)
-    if sheet_name not in wb.sheetnames:
+    st = path.stat()
+    key = (str(path), sheet_name)
+    ent = _READ_CACHE.get(key)
+    if ent is not None and ent[0] == st.st_mtime_ns and ent[1] == st.st_size:
+        return ent[2]
+    raw = _parse_rows(path, sheet_name)
+    if raw is None:
         return []
-    ws = wb[sheet_name]
-    rows: List[Tuple[str, str, str]] = []
-    for row in ws.iter_rows(min_row=2, values_only=True):
-        approval_date, req_num, description = (row + (None, None, None))[:3]
-        if approval_date is None and req_num is None and description is None:
-            continue
-        if isinstance(approval_date, (datetime, date)):
-            dstr = approval_date.strftime("%Y-%m-%d")
-        elif approval_date:
-            dstr = str(approval_date)
-        else:
-            dstr = ""
-        rows.append((dstr, str(req_num or ""), description or ""))
+    # Dates stay as read; EntriesModel formats them only for rows that are displayed
+    rows: List[Row] = [
+        (approval_date, str(req_num or ""), description or "")
+        for approval_date, req_num, description in raw
+        if approval_date is not None or req_num is not None or description is not None
+    ]
+    _READ_CACHE[key] = (st.st_mtime_ns, st.st_size, rows)
     return rows
 
 
@@ -191,6 +451,12 @@ def emoji_icon(emoji: str, size: int = 128,
     return QIcon(pm)
 
 
+@functools.lru_cache(maxsize=None)
+def _emoji_icon_cached(emoji: str, size: int = 128) -> QIcon:
+    # QIcon is implicitly shared, so handing out the same instance is safe
+    return emoji_icon(emoji, size)
+
+
 def load_window_icon() -> QIcon:
     # Try common icon names next to the script/exe
     for name in ("app.ico", "app.png", "app.icns"):
@@ -198,17 +464,158 @@ def load_window_icon() -> QIcon:
         if p.exists():
             return QIcon(str(p))
     # Fallback
-    return emoji_icon("📡")
+    return _emoji_icon_cached("📡")
+
+
+class EntriesModel(QAbstractTableModel):
+    """Read-only model over (date, request number, description) rows; no per-cell items."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Row] = []
+
+    def set_rows(self, rows: List[Row]):
+        # Same list (e.g. an unchanged file re-read from cache): views are already current
+        if rows is self._rows:
+            return
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def add_row(self, row: Row):
+        n = len(self._rows)
+        self.beginInsertRows(QModelIndex(), n, n)
+        self._rows.append(row)
+        self.endInsertRows()
+
+    def row_values(self, row: int) -> Tuple[str, str, str]:
+        d, req, desc = self._rows[row]
+        return format_date(d), req, desc
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            value = self._rows[index.row()][index.column()]
+            return format_date(value) if index.column() == 0 else value
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class ExcelWorker(QObject):
+    """
+    Owns the workbook and does all Excel file I/O on a background thread.
+    Requests arrive as queued signal calls (in order); results go back as signals.
+    """
+    loaded = Signal(str, object)       # sheet, rows
+    appended = Signal(str, object)     # sheet, (date, request number, description)
+    reloaded = Signal()                # file changed on disk; cached rows are stale
+    queued = Signal(int, str)          # entries waiting for a successful save, save error
+    read_failed = Signal(str)          # message (opening or reading the file)
+    append_failed = Signal(str)        # message (entry rejected)
+
+    def __init__(self, path: Path):
+        super().__init__()
+        self.path = path
+        # Long-lived workbook for appends; each Add only appends a row and saves.
+        # Reloaded only when the file's mtime changes (e.g. edited via "Open Excel").
+        self._wb = None
+        self._wb_mtime: Optional[int] = None
+        # Entries not saved yet because the file was locked; retried with the next Add
+        self._pending: List[Tuple[str, date, str, str]] = []
+
+    def _workbook(self):
+        mtime = self.path.stat().st_mtime_ns if self.path.exists() else None
+        if self._wb is None or mtime != self._wb_mtime:
+            self._wb = ensure_workbook_and_sheets(self.path)
+            self._wb_mtime = self.path.stat().st_mtime_ns
+            self.reloaded.emit()
+        return self._wb
+
+    @Slot()
+    def ensure(self):
+        # Create/migrate the workbook up front so the table reads the current layout
+        try:
+            self._workbook()
+        except Exception as e:
+            self.read_failed.emit(f"Failed to open Excel:\n{e}")
+
+    @Slot(str)
+    def load(self, sheet: str):
+        try:
+            rows = read_rows(self.path, sheet)
+        except Exception as e:
+            self.read_failed.emit(f"Failed to read Excel:\n{e}")
+            return
+        self.loaded.emit(sheet, rows)
+
+    @Slot(str, object, str, str)
+    def append(self, sheet: str, d: date, req_num: str, desc: str):
+        self._pending.append((sheet, d, req_num, desc))
+        try:
+            append_rows(self._workbook(), self.path, self._pending)
+            self._wb_mtime = self.path.stat().st_mtime_ns
+        except PermissionError as e:
+            # The workbook now holds unsaved rows; reload it from disk and
+            # re-append everything pending on the next attempt
+            self._wb = None
+            self.queued.emit(len(self._pending), str(e))
+            return
+        except Exception as e:
+            self._wb = None
+            self._pending.pop()
+            self.append_failed.emit(f"Failed to add entry:\n{e}")
+            return
+        flushed = len(self._pending) > 1
+        self._pending = []
+        if flushed:
+            # Earlier queued entries were never shown; re-read the table
+            self.reloaded.emit()
+        self.appended.emit(sheet, (d, req_num, desc))
 
 
 class MainWindow(QMainWindow):
+    # Queued requests to the ExcelWorker thread
+    _request_ensure = Signal()
+    _request_load = Signal(str)
+    _request_append = Signal(str, object, str, str)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(APP_TITLE)
         self.setMinimumSize(980, 680)
         self.setWindowIcon(load_window_icon())
 
-        ensure_workbook_and_sheets(EXCEL_PATH)
+        # Rows per sheet as shown in the table; read once, then kept current on Add
+        self._rows: Dict[str, List[Row]] = {}
+        # Sheets with a load already queued on the worker
+        self._loading = set()
+
+        # Excel I/O runs on a worker thread so saves and loads don't freeze the UI
+        self._worker = ExcelWorker(EXCEL_PATH)
+        self._thread = QThread(self)
+        self._worker.moveToThread(self._thread)
+        self._request_ensure.connect(self._worker.ensure)
+        self._request_load.connect(self._worker.load)
+        self._request_append.connect(self._worker.append)
+        self._worker.loaded.connect(self._on_loaded)
+        self._worker.appended.connect(self._on_appended)
+        # Slots must be MainWindow methods: plain callables would run on the worker thread
+        self._worker.reloaded.connect(self._on_reloaded)
+        self._worker.queued.connect(self._on_queued)
+        self._worker.read_failed.connect(self._on_read_failed)
+        self._worker.append_failed.connect(self._on_append_failed)
+        # Entries the worker is holding until the file can be saved
+        self._unsaved = 0
+        self._thread.start()
 
         central = QWidget()
         root = QVBoxLayout(central)
@@ -273,7 +680,12 @@ class MainWindow(QMainWindow):
         desc_frame = QVBoxLayout()
         lbl_desc = QLabel("Description of Work (multi-line allowed)")
         self.desc_text = QTextEdit()
-        self.desc_text.textChanged.connect(self.update_preview)
+        # Coalesce bursts of keystrokes into one preview update
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(80)
+        self._preview_timer.timeout.connect(self._do_update_preview)
+        self.desc_text.textChanged.connect(self._preview_timer.start)
         self.desc_text.setPlaceholderText("Enter work description; multiple lines will be joined with commas")
         desc_frame.addWidget(lbl_desc)
         desc_frame.addWidget(self.desc_text)
@@ -295,7 +707,7 @@ class MainWindow(QMainWindow):
         self.btn_open = QPushButton("Open Excel")
         self.btn_open.clicked.connect(self.open_excel)
         self.btn_refresh = QPushButton("Refresh List")
-        self.btn_refresh.clicked.connect(self.load_table)
+        self.btn_refresh.clicked.connect(self.refresh)
 
         tip = QLabel("Shortcuts: Ctrl+Enter Add • Ctrl+L Clear • Ctrl+T Today • Ctrl+O Open • F5 Refresh")
         tip.setStyleSheet("color:#4A6C74;")
@@ -309,13 +721,15 @@ class MainWindow(QMainWindow):
         root.addLayout(btn_row)
 
         # Table (3 columns)
-        self.table = QTableWidget(0, 3)
-        self.table.setHorizontalHeaderLabels(HEADERS)
+        self.model = EntriesModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        # Sized once per load in load_table; ResizeToContents re-measures on every row change
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Interactive)
+        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Interactive)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.on_table_context_menu)
@@ -330,9 +744,9 @@ class MainWindow(QMainWindow):
         # Shortcuts
         self._add_shortcuts()
 
-        # Initial load
-        self.load_table()
-        self.update_preview()
+        # Initial load (after the window has painted)
+        QTimer.singleShot(0, self._initial_load)
+        self._do_update_preview()
 
         # Styling
         self._apply_styles()
@@ -342,7 +756,7 @@ class MainWindow(QMainWindow):
             QWidget {{ background: {BG_LIGHT}; color: {TEXT_PRIMARY}; }}
             QRadioButton, QLabel {{ font-size: 12px; }}
             QTextEdit {{ background: white; border: 1px solid #D0E3E6; }}
-            QTableWidget {{ background: white; alternate-background-color: {ROW_ALT}; }}
+            QTableView {{ background: white; alternate-background-color: {ROW_ALT}; }}
             QPushButton {{ padding: 6px 10px; }}
         """)
 
@@ -358,7 +772,7 @@ class MainWindow(QMainWindow):
         add_seq("Ctrl+L", self.on_clear)
         add_seq("Ctrl+T", self.set_today)
         add_seq("Ctrl+O", self.open_excel)
-        add_seq("F5", self.load_table)
+        add_seq("F5", self.refresh)
 
     def set_today(self):
         self.date_edit.setDate(QDate.currentDate())
@@ -366,10 +780,12 @@ class MainWindow(QMainWindow):
     def on_clear(self):
         self.desc_text.clear()
         # Do not clear date; we handle Request Number after adding
-        self.update_preview()
+        self._do_update_preview()
 
     def on_add(self):
-        sheet = "CR" if self.rb_cr.isChecked() else "WP"
+        if not self.btn_add.isEnabled():
+            return  # previous Add still saving (keyboard shortcut)
+        sheet = self._current_sheet()
 
         # Convert QDate to Python date
         dqt = self.date_edit.date()
@@ -387,50 +803,103 @@ class MainWindow(QMainWindow):
         #     QMessageBox.critical(self, "Missing request number", "Please enter the Request Number.")
         #     return
 
-        try:
-            append_row(EXCEL_PATH, sheet, d_py, req_num, desc)
-        except PermissionError as e:
-            QMessageBox.critical(self, "Cannot save", str(e))
-            return
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to add entry:\n{e}")
-            return
-
-        self.update_status(f"Added to '{sheet}': {d_py.strftime('%Y-%m-%d')}")
+        # One Add at a time; re-enabled when the worker reports back
+        self.btn_add.setEnabled(False)
+        self.update_status("Saving…")
+        self._request_append.emit(sheet, d_py, req_num, desc)
 
-        # Prepare for next entry:
+    def _prepare_next_entry(self):
         # 1) Clear description
         self.on_clear()
         # 2) Clear Request Number to avoid accidental reuse
         self.req_edit.clear()
         self.req_edit.setFocus()
-        # 3) Refresh table
+
+    def _on_appended(self, sheet: str, row: Row):
+        self.btn_add.setEnabled(True)
+        self._unsaved = 0
+        self.update_status(f"Added to '{sheet}': {format_date(row[0])}")
+
+        # Prepare for next entry
+        self._prepare_next_entry()
+        # Show the new row without re-reading the sheet
+        rows = self._rows.get(sheet)
+        if rows is None:
+            self.load_table()
+        else:
+            # Only if that sheet is on screen: the model then holds the cached list
+            if sheet == self._current_sheet():
+                self.model.add_row(row)
+                self.table.scrollToBottom()
+            else:
+                rows.append(row)
+
+    def _on_queued(self, count: int, message: str):
+        # The entry is accepted but not in the file yet; the next Add retries the save
+        self.btn_add.setEnabled(True)
+        self._unsaved = count
+        self._prepare_next_entry()
+        self.update_status(f"{count} entr{'y' if count == 1 else 'ies'} waiting to be saved")
+        QMessageBox.warning(
+            self, "Cannot save",
+            f"{message}\n\nThe entry is kept and will be saved together with your next Add "
+            f"({count} waiting)."
+        )
+
+    def _on_append_failed(self, message: str):
+        self.btn_add.setEnabled(True)
+        QMessageBox.critical(self, "Error", message)
+
+    def _on_read_failed(self, message: str):
+        self._loading.clear()
+        QMessageBox.critical(self, "Error", message)
+
+    def _on_reloaded(self):
+        # The file changed on disk; cached rows are stale
+        self._rows.clear()
+
+    def _initial_load(self):
+        self._request_ensure.emit()
         self.load_table()
 
+    def _current_sheet(self) -> str:
+        return "CR" if self.rb_cr.isChecked() else "WP"
+
+    def _on_loaded(self, sheet: str, rows: List[Row]):
+        self._loading.discard(sheet)
+        self._rows[sheet] = rows
+        if sheet == self._current_sheet():
+            self.load_table()
+
     def on_sheet_changed(self):
         self.load_table()
 
-    def update_preview(self):
-        text = self.desc_text.toPlainText().strip()
-        combined = normalize_description(text)
+    def _do_update_preview(self):
+        if self.desc_text.document().isEmpty():
+            self.preview.setText("(nothing yet)")
+            return
+        # normalize_description strips each line itself
+        combined = normalize_description(self.desc_text.toPlainText())
         self.preview.setText(combined or "(nothing yet)")
 
+    def refresh(self):
+        # Explicit refresh: drop cached rows and re-read from the file
+        self._rows.clear()
+        self.load_table()
+
     def load_table(self):
-        sheet = "CR" if self.rb_cr.isChecked() else "WP"
-        try:
-            ensure_workbook_and_sheets(EXCEL_PATH)
-            rows = read_rows(EXCEL_PATH, sheet)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to read Excel:\n{e}")
+        sheet = self._current_sheet()
+        rows = self._rows.get(sheet)
+        if rows is None:
+            if sheet not in self._loading:
+                self._loading.add(sheet)
+                self._request_load.emit(sheet)
+            self.update_status(f"File: {EXCEL_PATH} • Loading {sheet}…")
             return
 
-        self.table.setRowCount(0)
-        for dstr, req, desc in rows:
-            r = self.table.rowCount()
-            self.table.insertRow(r)
-            self.table.setItem(r, 0, QTableWidgetItem(dstr))
-            self.table.setItem(r, 1, QTableWidgetItem(req))
-            self.table.setItem(r, 2, QTableWidgetItem(desc))
+        self.model.set_rows(rows)
+        self.table.resizeColumnToContents(0)
+        self.table.resizeColumnToContents(1)
 
         self.update_status(f"File: {EXCEL_PATH} • {sheet} records: {len(rows)}")
 
@@ -446,12 +915,10 @@ class MainWindow(QMainWindow):
         menu.exec(self.table.viewport().mapToGlobal(pos))
 
     def copy_selected_row(self):
-        row = self.table.currentRow()
+        row = self.table.currentIndex().row()
         if row < 0:
             return
-        d = self.table.item(row, 0).text() if self.table.item(row, 0) else ""
-        req = self.table.item(row, 1).text() if self.table.item(row, 1) else ""
-        desc = self.table.item(row, 2).text() if self.table.item(row, 2) else ""
+        d, req, desc = self.model.row_values(row)
         text = f"{d}\t{req}\t{desc}"
         QApplication.clipboard().setText(text)
         self.update_status("Row copied to clipboard.")
@@ -473,8 +940,29 @@ class MainWindow(QMainWindow):
     def update_status(self, text: str):
         self.status.showMessage(text)
 
+    def closeEvent(self, event):
+        if self._unsaved:
+            resp = QMessageBox.question(
+                self, "Unsaved entries",
+                f"{self._unsaved} entr{'y is' if self._unsaved == 1 else 'ies are'} not saved yet "
+                "because the Excel file could not be written.\nQuit anyway and lose them?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+            )
+            if resp != QMessageBox.Yes:
+                event.ignore()
+                return
+        # Let a pending save finish before exiting
+        self._thread.quit()
+        self._thread.wait()
+        super().closeEvent(event)
+
 
 def main():
+    # openpyxl is imported lazily where it is used; fail early if it is missing
+    if importlib.util.find_spec("openpyxl") is None:
+        print("This tool requires 'openpyxl'. Install it with: pip install openpyxl", file=sys.stderr)
+        sys.exit(1)
+
     # Windows: set AppUserModelID for proper taskbar icon/grouping
     if sys.platform == "win32":
         try:
@@ -482,8 +970,6 @@ def main():
         except Exception:
             pass
 
-    ensure_workbook_and_sheets(EXCEL_PATH)
-
     app = QApplication(sys.argv)
     app.setApplicationName(APP_TITLE)
 